@@ -27,9 +27,14 @@ Implementation Notes
   https://circuitpython.org/downloads
 """
 
-import random
+import os
 import ulab.numpy as np
 
+try:
+    _RNG = np.random.Generator()
+except (AttributeError, TypeError):
+    _RNG = None  # The ulab random module is not included in this build
+
 
 # pylint: disable=too-few-public-methods
 class WaveShape:
@@ -42,6 +47,29 @@ class WaveShape:
     Triangle = "triangle"
 
 
+# The fraction of lambda that must be resolved by each wave shape
+_FRACTION = {
+    WaveShape.Noise: 1,  # One lambda
+    WaveShape.Saw: 2,  # One-half lambda
+    WaveShape.Sine: 1,  # One lambda
+    WaveShape.Square: 2,  # One-half lambda
+    WaveShape.Triangle: 4,  # One-quarter lambda
+}
+
+# Single-wavelength sine tables shared by all instances, indexed by table length
+_SINE_TABLES = {}
+
+
+def _sine_table(table_length):
+    """Returns a cached single-wavelength sine table of the specified length."""
+    if table_length not in _SINE_TABLES:
+        _SINE_TABLES[table_length] = np.sin(
+            np.linspace(0, 2 * np.pi, table_length, endpoint=False)
+        )
+    return _SINE_TABLES[table_length]
+
+
+# pylint: disable=too-many-instance-attributes
 class WaveBuilder:
     """The WaveBuilder class creates a composite ``synthio`` waveform table
     from a collection of oscillators. The table is created from a list
@@ -68,9 +96,10 @@ class WaveBuilder:
     an oscillator with a much higher frequency than the fundamental is
     included. Use cautiously since synthio expects a single wavelength to
     be contained in a wave table. Defaults to 1.0.
-    :param boolean loop_smoothing: Smooth the transition between the start
-    and end of the waveform table to reduce loop distortion. Defaults
-    to ``True`` (smooth the last two sample values in the waveform table).
+    :param integer loop_smoothing: The number of samples at the end of the
+    waveform table that are crossfaded into the start of the table to reduce
+    loop distortion. ``True`` crossfades 8 samples; ``False`` or 0 disables
+    loop smoothing. Defaults to ``True``.
     :param bool debug: A boolean value to enable debug print messages.
     Defaults to ``False`` (no debug print messages)."""
 
@@ -85,13 +114,16 @@ class WaveBuilder:
         debug=False,
     ):
         self._oscillators = oscillators
+        self._oscillators_input = oscillators
         self._table_length = table_length
         self._sample_max = int(sample_max)
         self._lambda_factor = lambda_factor
         self._loop_smoothing = loop_smoothing
         self._debug = debug
+        self._base_phase = None
 
         self._update_table()
+        self._settings_key = self._settings()
 
     @property
     def oscillators(self):
@@ -102,7 +134,8 @@ class WaveBuilder:
     @oscillators.setter
     def oscillators(self, new_oscillators):
         self._oscillators = new_oscillators
-        self._update_table()
+        self._oscillators_input = new_oscillators
+        self._update_table_if_changed()
 
     @property
     def table_length(self):
@@ -112,7 +145,7 @@ class WaveBuilder:
     @table_length.setter
     def table_length(self, new_table_length):
         self._table_length = new_table_length
-        self._update_table()
+        self._update_table_if_changed()
 
     @property
     def sample_max(self):
@@ -123,7 +156,7 @@ class WaveBuilder:
     @sample_max.setter
     def sample_max(self, new_sample_max=32767):
         self._sample_max = int(new_sample_max)
-        self._update_table()
+        self._update_table_if_changed()
 
     @property
     def lambda_factor(self):
@@ -133,18 +166,19 @@ class WaveBuilder:
     @lambda_factor.setter
     def lambda_factor(self, new_lambda_factor=1.0):
         self._lambda_factor = new_lambda_factor
-        self._update_table()
+        self._update_table_if_changed()
 
     @property
     def loop_smoothing(self):
-        """Smooth the transition between the start and end of the waveform table
-        to reduce loop distortion."""
+        """The number of samples crossfaded between the end and start of the
+        waveform table to reduce loop distortion. ``True`` crossfades 8 samples;
+        ``False`` or 0 disables loop smoothing."""
         return self._loop_smoothing
 
     @loop_smoothing.setter
     def loop_smoothing(self, new_loop_smoothing):
         self._loop_smoothing = new_loop_smoothing
-        self._update_table()
+        self._update_table_if_changed()
 
     @property
     def debug(self):
@@ -158,14 +192,17 @@ class WaveBuilder:
     @property
     def wave_table(self):
         """The composite waveform wave table; synthio.ReadableBuffer of type
-        ‘h’ (signed 16 bit)."""
+        ‘h’ (signed 16 bit). A new wave table is created whenever a property
+        change updates the table; previously returned tables are unchanged."""
         return self._waveform
 
     @property
     def loop_distortion(self):
         """The loop distortion value. The value is based on the difference
         between the first and last sample values of the wave table,
-        calculated as a percentage."""
+        calculated as a percentage. With loop smoothing enabled, the last
+        sample leads into the first rather than matching it, so a smooth
+        table reports about one sample step instead of 0%."""
         return self._loop_distortion
 
     @property
@@ -174,205 +211,227 @@ class WaveBuilder:
         return self._summed_amplitude
 
     # pylint: disable=unused-argument
-    def _noise_wave(self, ratio, amplitude):
-        """Returns a sample array with a noise waveform adjusted to a specified amplitude."""
-        amp_factor = abs(
-            min(int(round(self._sample_max * amplitude, 0)), self._sample_max)
-        )
-        _temporary = np.array(
-            [
-                random.randint(-amp_factor, amp_factor)
-                for _ in range(self._table_length)
-            ],
-            dtype=np.int16,
-        )
-        return _temporary
-
-    def _saw_wave(self, ratio, amplitude):
-        """Returns a waveform array with a saw wave waveform proportional
-        to the frequency ratio and adjusted to a specified amplitude."""
-        amp_factor = min(int(round(self._sample_max * amplitude, 0)), self._sample_max)
-        _temporary = np.array([], dtype=np.int16)  # Create a zero-length array
-
-        # Calculate the array length and subtract the initial zero element
-        half_lambda = int((self._table_length / (self._lambda_factor * 2)) / ratio)
-
-        # Build the waveform array from a full-lambda waveform
-        while len(_temporary) < self._table_length:
-            _temporary = np.concatenate(
-                (
-                    _temporary,
-                    np.linspace(
-                        0,
-                        int(amp_factor),
-                        half_lambda - 1,
-                        dtype=np.int16,
-                    ),
-                    np.array([0], dtype=np.int16),
-                    np.linspace(
-                        int(-amp_factor),
-                        0,
-                        half_lambda - 1,
-                        dtype=np.int16,
-                    ),
-                )
+    # pylint: disable=no-self-use
+    def _noise_wave(self, ratio, amp_factor, out):
+        """Adds a noise waveform adjusted to a specified amplitude factor to
+        the ``out`` waveform array."""
+        amp_factor = abs(amp_factor)
+        if _RNG is not None:
+            # Scale uniform random values from 0.0 to 1.0 to the amplitude range
+            samples = _RNG.random(size=len(out))
+            samples *= 2 * amp_factor
+            samples -= amp_factor
+            out += samples
+        else:
+            # Scale random signed 16-bit values to the amplitude range
+            out += np.frombuffer(os.urandom(len(out) * 2), dtype=np.int16) * (
+                amp_factor / 32768
             )
 
-        # Truncate the temporary array to match table_length
-        _temporary = _temporary[: self._table_length]
-        return _temporary
-
-    def _sine_wave(self, ratio, amplitude):
-        """Returns a waveform array with a sine wave waveform proportional
-        to the frequency ratio and adjusted to a specified amplitude."""
-        amp_factor = min(int(round(self._sample_max * amplitude, 0)), self._sample_max)
-        _temporary = np.array(
-            np.sin(
-                np.linspace(
-                    0,
-                    self._lambda_factor * 2 * np.pi * ratio,
-                    self._table_length,
-                    endpoint=False,
-                )
-            )
-            * amp_factor,
-            dtype=np.int16,
+    def _saw_wave(self, ratio, amp_factor, out):
+        """Adds a saw wave waveform proportional to the frequency ratio and
+        adjusted to a specified amplitude factor to the ``out`` waveform array."""
+        # Build the waveform array from the fractional position within each lambda
+        cycles = self._base_phase * (ratio / (2 * np.pi))
+        cycles -= np.floor(cycles + 0.5)
+        cycles *= 2 * amp_factor
+        out += cycles
+
+    def _sine_waves(self, ratios, amp_factors, out):
+        """Adds the sum of sine wave waveforms proportional to an array of
+        frequency ratios and adjusted to an array of amplitude factors to the
+        ``out`` waveform array. All sine waves are looked up in a single
+        two-dimensional pass from a shared sine table with one row per wave
+        table sample."""
+        table_length = len(out)
+
+        # Calculate the nearest sine table index for each wave at every sample
+        indices = np.floor(
+            self._base_phase.reshape((table_length, 1))
+            * (ratios * (table_length / (2 * np.pi)))
+            + 0.5
         )
-        return _temporary
-
-    def _square_wave(self, ratio, amplitude):
-        """Returns a waveform array with a square wave waveform proportional
-        to the frequency ratio and adjusted to a specified amplitude."""
-        amp_factor = min(int(round(self._sample_max * amplitude, 0)), self._sample_max)
-        # Create a zero-length temporary array
-        _temporary = np.array([], dtype=np.int16)
-
-        # Calculate the sample length of one-half lambda
-        half_lambda = int((self._table_length / (self._lambda_factor * 2)) / ratio)
-
-        # Build the waveform array from a full-lambda waveform
-        while len(_temporary) < self._table_length:
-            _temporary = np.concatenate(
-                (
-                    _temporary,
-                    np.array([0], dtype=np.int16),
-                    np.ones(half_lambda - 1, dtype=np.int16) * int(amp_factor),
-                    np.array([0], dtype=np.int16),
-                    np.ones(half_lambda - 1, dtype=np.int16) * int(-amp_factor),
-                )
-            )
+        indices -= np.floor(indices / table_length) * table_length
 
-        # Truncate the temporary array to match table_length
-        _temporary = _temporary[: self._table_length]
-        return _temporary
+        samples = np.take(
+            _sine_table(table_length),
+            np.array(indices.flatten(), dtype=np.uint16),
+        ).reshape((table_length, len(ratios)))
+        samples *= amp_factors
+        out += np.sum(samples, axis=1)
 
-    def _triangle_wave(self, ratio, amplitude):
-        """Returns a waveform array with a triangle wave waveform proportional
-        to the frequency ratio and adjusted to a specified amplitude."""
-        amp_factor = min(int(round(self._sample_max * amplitude, 0)), self._sample_max)
-        # Create a zero-length temporary array
-        _temporary = np.array([], dtype=np.int16)
+    def _square_wave(self, ratio, amp_factor, out):
+        """Adds a square wave waveform proportional to the frequency ratio and
+        adjusted to a specified amplitude factor to the ``out`` waveform array."""
+        table_length = len(out)
 
-        # Calculate the sample length of one-quarter lambda
-        quarter_lambda = int((self._table_length / (self._lambda_factor * 4)) / ratio)
-
-        # Calculate a one-step increment for even quarter-lambda segments
-        increment = int(amp_factor / quarter_lambda)
+        # Calculate the sample length of one-half lambda
+        half_lambda = int((table_length / (self._lambda_factor * 2)) / ratio)
 
-        # Build the waveform array from a full-lambda waveform
-        while len(_temporary) < self._table_length:
-            _temporary = np.concatenate(
-                (
-                    _temporary,
-                    np.linspace(
-                        0,
-                        amp_factor,
-                        quarter_lambda,
-                        dtype=np.int16,
-                    ),
+        # Build the waveform array from the sign of a full-lambda sine wave
+        _temporary = np.array(
+            np.where(
+                np.sin(
                     np.linspace(
-                        amp_factor - increment,
                         0,
-                        quarter_lambda,
-                        dtype=np.int16,
-                    ),
-                    np.linspace(
-                        0 - increment,
-                        -amp_factor,
-                        quarter_lambda,
-                        dtype=np.int16,
-                    ),
-                    np.linspace(
-                        -amp_factor + increment,
-                        0 - increment,
-                        quarter_lambda,
-                        dtype=np.int16,
-                    ),
+                        np.pi * table_length / half_lambda,
+                        table_length,
+                        endpoint=False,
+                    )
                 )
-            )
+                >= 0,
+                amp_factor,
+                -amp_factor,
+            ),
+            dtype=np.int16,
+        )
 
-        # Truncate the temporary array to match table_length
-        _temporary = _temporary[: self._table_length]
-        return _temporary
+        # Restore the zero-crossing samples at each one-half lambda boundary
+        _temporary[::half_lambda] = 0
+        out += _temporary
+
+    def _triangle_wave(self, ratio, amp_factor, out):
+        """Adds a triangle wave waveform proportional to the frequency ratio and
+        adjusted to a specified amplitude factor to the ``out`` waveform array."""
+        # Build the waveform array from the arcsine of a sine wave
+        samples = np.asin(np.sin(self._base_phase * ratio))
+        samples *= (2 / np.pi) * amp_factor
+        out += samples
+
+    # Wave shape methods indexed by WaveShape member; sine waves are batched
+    _WAVE_FUNCTIONS = {
+        WaveShape.Noise: _noise_wave,
+        WaveShape.Saw: _saw_wave,
+        WaveShape.Square: _square_wave,
+        WaveShape.Triangle: _triangle_wave,
+    }
+
+    def _settings(self):
+        """Returns a comparable snapshot of the wave table settings. The
+        oscillators are recorded as provided by the caller, before
+        frequencies are replaced with ratios."""
+        return (
+            tuple(self._oscillators_input),
+            self._table_length,
+            self._sample_max,
+            self._lambda_factor,
+            self._loop_smoothing,
+            # True and 1 are equal but specify different smoothing lengths
+            isinstance(self._loop_smoothing, bool),
+        )
+
+    def _update_table_if_changed(self):
+        """Updates the wave table unless the settings match those of the last
+        successful update. The settings are recorded only after the update
+        succeeds so that repeating a rejected value raises the exception
+        again."""
+        settings_key = self._settings()
+        if settings_key == self._settings_key:
+            return
+        self._update_table()
+        self._settings_key = settings_key
 
-    # pylint: disable=consider-using-generator
-    # pylint: disable=too-many-branches
+    # pylint: disable=too-many-locals
     def _update_table(self):
+        table_length = self._table_length
+        sample_max = self._sample_max
+        lambda_factor = self._lambda_factor
+
+        # Split the oscillator characteristics into shape, frequency, and amplitude
+        shapes = [osc[0] for osc in self._oscillators]
+        frequencies = np.array([osc[1] for osc in self._oscillators])
+        amplitudes = np.array([osc[2] for osc in self._oscillators])
+
         # Replace frequencies in _oscillators with ratios based on the fundamental
-        fundamental_frequency = min([osc[1] for osc in self._oscillators])
+        ratios = frequencies / np.min(frequencies)
         self._oscillators = [
-            (t, freq / fundamental_frequency, a) for t, freq, a in self._oscillators
+            (osc[0], ratio, osc[2]) for osc, ratio in zip(self._oscillators, ratios)
         ]
 
-        self._summed_amplitude = sum([abs(osc[2]) for osc in self._oscillators])
+        self._summed_amplitude = float(np.sum(abs(amplitudes)))
         if self._summed_amplitude > 1.0:
             raise ValueError("Summed amplitude of oscillators exceeds 1.0.")
 
         # Test each oscillator ratio to confirm that table_length has sufficient resolution
         for overtone in self._oscillators:
-            fraction = 1  # Set one lambda for sine and noise wave shapes
-            if WaveShape.Square or WaveShape.Saw in overtone[0]:
-                fraction = 2  # For one-half lambda
-            if WaveShape.Triangle in overtone:
-                fraction = 4  # For one-quarter lambda
-
-            if (
-                int(
-                    (self._table_length / (self._lambda_factor * fraction))
-                    / overtone[1]
-                )
-                < 2
-            ):
+            fraction = _FRACTION.get(overtone[0], 1)
+            if int((table_length / (lambda_factor * fraction)) / overtone[1]) < 2:
                 # A fractional lambda array must be two elements or larger
-                min_length = 2 + (2 * int(self._lambda_factor * fraction * overtone[1]))
+                min_length = 2 + (2 * int(lambda_factor * fraction * overtone[1]))
                 message = f"Increase to {min_length} or larger."
                 raise ValueError(
-                    f"table_length {self._table_length} is too small for oscillator {overtone}. "
+                    f"table_length {table_length} is too small for oscillator {overtone}. "
                     + message
                 )
 
-        # Add oscillator waveforms to an empty self._waveform wave table array
-        self._waveform = np.zeros(self._table_length, dtype=np.int16)
-        for wave_type, ratio, amplitude in self._oscillators:
-            if wave_type == WaveShape.Noise:
-                self._waveform = self._waveform + self._noise_wave(ratio, amplitude)
-            if wave_type == WaveShape.Saw:
-                self._waveform = self._waveform + self._saw_wave(ratio, amplitude)
-            if wave_type == WaveShape.Sine:
-                self._waveform = self._waveform + self._sine_wave(ratio, amplitude)
-            if wave_type == WaveShape.Square:
-                self._waveform = self._waveform + self._square_wave(ratio, amplitude)
-            if wave_type == WaveShape.Triangle:
-                self._waveform = self._waveform + self._triangle_wave(ratio, amplitude)
-
-        if self._loop_smoothing and (self._waveform[-1] != self._waveform[0]):
-            # Reduce loop distortion by smoothing the last 2 elements of the array
-            self._waveform[-2] = int((self._waveform[-2] + self._waveform[0]) / 2)
-            self._waveform[-1] = self._waveform[0]
+        # Scale each oscillator amplitude to the maximum sample value
+        amp_factors = [
+            min(int(round(sample_max * amplitude, 0)), sample_max)
+            for amplitude in amplitudes
+        ]
+
+        # Calculate the fundamental phase ramp shared by all oscillators
+        self._base_phase = np.linspace(
+            0,
+            lambda_factor * 2 * np.pi,
+            table_length,
+            endpoint=False,
+        )
+
+        # Add oscillator waveforms in place to an empty floating point accumulator
+        # that cannot overflow, then clip and convert it to the wave table array
+        accumulator = np.zeros(table_length)
+
+        # Add all sine oscillators in a single batch
+        sine_oscillators = [
+            (ratio, amp_factor)
+            for wave_type, ratio, amp_factor in zip(shapes, ratios, amp_factors)
+            if wave_type == WaveShape.Sine
+        ]
+        if sine_oscillators:
+            self._sine_waves(
+                np.array([osc[0] for osc in sine_oscillators]),
+                np.array([osc[1] for osc in sine_oscillators]),
+                out=accumulator,
+            )
+
+        # Add the remaining wave shapes one oscillator at a time
+        for wave_type, ratio, amp_factor in zip(shapes, ratios, amp_factors):
+            wave_function = self._WAVE_FUNCTIONS.get(wave_type)
+            if wave_function:
+                wave_function(self, ratio, amp_factor, out=accumulator)
+
+        # Reduce loop distortion with a raised-cosine crossfade of the last
+        # samples into a linear extension of the start of the accumulator. The
+        # extension is clipped to the range of the unsmoothed accumulator so that
+        # a table starting on a discontinuity, such as a square wave, does not
+        # overshoot its own peak values.
+        if self._loop_smoothing is True:
+            smoothing_length = 8
+        else:
+            smoothing_length = int(self._loop_smoothing)
+        smoothing_length = min(smoothing_length, table_length - 1)
+        if smoothing_length > 0:
+            weight = 0.5 * (1 - np.cos(np.linspace(0, np.pi, smoothing_length + 1)[1:]))
+            lead_in = np.clip(
+                accumulator[0]
+                + (np.arange(smoothing_length) - smoothing_length)
+                * (accumulator[1] - accumulator[0]),
+                np.min(accumulator),
+                np.max(accumulator),
+            )
+            tail = accumulator[-smoothing_length:]
+            accumulator[-smoothing_length:] = (1 - weight) * tail + weight * lead_in
+
+        self._waveform = np.array(
+            np.clip(accumulator, -sample_max, sample_max), dtype=np.int16
+        )
 
         # Calculate loop distortion
         self._loop_distortion = (
-            abs(self._waveform[0] - self._waveform[-1]) / self._sample_max * 100
+            abs(int(self._waveform[0]) - int(self._waveform[-1]))
+            / self._sample_max
+            * 100
         )
 
         if self._debug:
@@ -55,7 +55,7 @@ mixer = audiomixer.Mixer(
     channel_count=1,
     bits_per_sample=16,
     samples_signed=True,
-    buffer_size=2048,
+    buffer_size=1024,
 )
 audio.play(mixer)
 
@@ -14,12 +14,13 @@ import audiobusio
 import audiomixer
 from cedargrove_wavebuilder import WaveBuilder, WaveShape
 
-print("=== WaveBuilder Simpletest===")
-
 # Define synth parameters
 SAMPLE_RATE = 22050  # The sample rate in SPS
 WAVE_TABLE_LENGTH = 512  # The wave table length in samples
-PLOT = False  # Plot the wave table array via the REPL
+PLOT = False  # Plot the wave table array and print banners via the REPL
+
+if PLOT:
+    print("=== WaveBuilder Simpletest===")
 
 # Define the wave type, overtone ratio, and amplitude (0.0 to 1.0)
 chimes = [
@@ -38,9 +39,8 @@ wave = WaveBuilder(
 )
 
 if PLOT:
-    # Plot the wave_table array contents
-    for point in wave.wave_table:
-        print(f"({point / 1000}, )")
+    # Plot the wave_table array contents with a single print
+    print("\n".join("(%g, )" % (point / 1000) for point in wave.wave_table))
 
 # Define Chime ADSR envelope parameters
 chime_envelope = synthio.Envelope(
@@ -56,7 +56,7 @@ audio_output = audiobusio.I2SOut(
     bit_clock=board.D19, word_select=board.D18, data=board.D17, left_justified=False
 )
 mixer = audiomixer.Mixer(
-    sample_rate=SAMPLE_RATE, buffer_size=4096, voice_count=1, channel_count=1
+    sample_rate=SAMPLE_RATE, buffer_size=1024, voice_count=1, channel_count=1
 )
 audio_output.play(mixer)
 mixer.voice[0].level = 0.50
@@ -66,7 +66,8 @@ mixer.play(synth)
 
 note_1 = synthio.Note(880, envelope=chime_envelope)
 
-print("===")
+if PLOT:
+    print("===")
 
 while True:
     synth.press(note_1)
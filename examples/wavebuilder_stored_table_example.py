@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 JG for Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+"""
+===============================================================================
+An example of playing a stored WaveBuilder wave table to simulate wind chimes.
+The wind chime wave table is built once on a host or board and stored in this
+file so that the wave table is not rebuilt each time the board starts.
+
+The stored table was created from the wavebuilder_chime_example oscillators:
+
+    wave = WaveBuilder(
+        oscillators=[
+            (WaveShape.Sine, 1.0, 0.6),
+            (WaveShape.Sine, 2.76, 0.2),
+            (WaveShape.Sine, 5.40, 0.1),
+            (WaveShape.Sine, 8.93, 0.1),
+        ],
+        table_length=512,
+        sample_max=32700,
+        lambda_factor=1,
+        loop_smoothing=True,
+    )
+    print(wave.wave_table.tobytes().hex())
+"""
+
+import time
+import board
+import synthio
+import audiobusio
+import audiomixer
+import ulab.numpy as np
+
+# Define synth parameters
+SAMPLE_RATE = 22050  # The sample rate in SPS
+
+# The stored wind chime wave table; 512 signed 16-bit little-endian samples
+CHIME_TABLE_HEX = (
+    "000012044708f80b1110ec13ad17241b881e02222f25e327ce2a672de42fca31"
+    "c13393351a37373854393d3a1a3b6d3bd03b0b3c213c103cbb3b723b223bc43a"
+    "233ab6393039c5386138e8379a373b37ff36ed36cd36ea36f4364937b8371938"
+    "c0385539283af13ac13bda3ccb3deb3e11403541604269438744c045ae46a247"
+    "6d484849f849804af54a7b4bb14bc34bb54bc14b764b034b6f4acc4945499148"
+    "99478d46d645ae449b4366427d416c403f3f423e7e3d7c3cb63bfe3ab93a193a"
+    "97395e396e3978397d39a639153acc3a783b1f3ce23c213ef23e084014416d42"
+    "9a43b744df452d4734483149144a124bbf4b4e4c964c0a4d1c4d124dde4c684c"
+    "f74b204b354a1f49d3476746b444ff424e41393f303dec3abe3885361e34df31"
+    "712f3f2d1c2be728db26dd242723b2212820c91e9e1dc41c1e1c691b2f1b191b"
+    "4f1b841b171cea1ce81dc11e1b209f214723d224b526af28ca2a9b2cd02ef630"
+    "1a335135163719390c3be63c783e1940be411b4301443945204608474f47bd47"
+    "2c4867483f481b48d7479947d2465e46b445fa444d44374377429a41bf40bb3f"
+    "063f463e853d9d3cfe3b6a3be73a4a3aee399a3960390539eb38de38ab389538"
+    "863892389e3887387c38513838380e38a8375037b4362036563557345a330c32"
+    "d230592f8e2dbe2bbf299c275025bc224d20771da01ac917a914c011830e4c0b"
+    "0e08ff04c4018cfe65fb91f894f5aff2efefafed2cebe0e8b0e60ce538e393e1"
+    "38e042df4cde67ddafdc46dc34dc02dce7dbebdb82dcbadc2ddd87dd38dec8de"
+    "30dfbadf5de0a6e001e101e16ee155e11be1d7e08fe0f5df19df11deefdcc5db"
+    "44da8cd8add6d9d4cad27fd018cebccb1bc971c6acc307c143be6bbbb0b8f5b5"
+    "53b3c6b051aefcab9fa988a79aa5b1a311a27fa0449f3b9e279d7f9cdf9b989b"
+    "479b2e9b679ba49b029ca89c4c9d2b9ed49edc9ff2a0fda1eda206a411a53aa6"
+    "53a72aa831a92faa1babb0ab76ac30adcdad0aae8daeedae51af5caf8fafd1af"
+    "efafd4afe7aff9af30b0fbaf44b074b0b4b02eb148b10fb2a7b25cb30bb4fdb4"
+    "36b66ab778b812baa8bb7dbd0dbffbc01cc31fc526c75fc9a4cb00ce1cd075d2"
+    "bbd4f6d624d914db10ddf0deafe022e275e3aee4c6e59be63be7bae7e9e7f4e7"
+    "d2e75ae7cbe6eae5f9e4d8e380e21de161dfacdddadbc9d9ead7bcd5aed39dd1"
+    "8fcf8ccd71cb8dc90fc83dc6aac41ec30cc2eec0e6bf23bfbcbe5bbe2bbe21be"
+    "97bef5be85bf25c009c15cc291c3ddc444c621c8b4c96bcb17cd17cfe5d093d2"
+    "59d425d6b2d74fd9b2da6fdc9bdda8debcdfd3e0a2e125e286e2ece24fe389e3"
+    "69e32de33de3cfe26ee2dde17be1efe043e0aedf38df96de0fdea7dd64ddfedc"
+    "b3dc86dc94dc9cdcc8dc17dd81dd2aded9de3ce0cce2b0e6bfeb7df129f7eefb"
+)
+
+# Convert the stored samples to a wave table without rebuilding it
+chime_table = np.frombuffer(bytes.fromhex(CHIME_TABLE_HEX), dtype=np.int16)
+
+# Define Chime ADSR envelope parameters
+chime_envelope = synthio.Envelope(
+    attack_time=0.02 + 0.01,
+    attack_level=1.0 * 1.0,
+    decay_time=0.0,
+    release_time=2.0,
+    sustain_level=1.0,
+)
+
+# Configure synthesizer for I2S output on a Feather S2
+audio_output = audiobusio.I2SOut(
+    bit_clock=board.D19, word_select=board.D18, data=board.D17, left_justified=False
+)
+mixer = audiomixer.Mixer(
+    sample_rate=SAMPLE_RATE, buffer_size=1024, voice_count=1, channel_count=1
+)
+audio_output.play(mixer)
+mixer.voice[0].level = 0.50
+
+synth = synthio.Synthesizer(sample_rate=SAMPLE_RATE, waveform=chime_table)
+mixer.play(synth)
+
+note_1 = synthio.Note(880, envelope=chime_envelope)
+
+while True:
+    synth.press(note_1)
+    synth.release(note_1)
+    time.sleep(0.5)